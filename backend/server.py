@@ -4,22 +4,118 @@ FastAPI server for Danish Rent Roll Parser.
 Provides REST API endpoints for parsing rent roll files.
 """
 
+import asyncio
+import hashlib
+import multiprocessing
 import os
 import tempfile
-from typing import Union
-
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import Optional, Union
+
+import orjson
+from fastapi import FastAPI, File, UploadFile, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from parser import parse_rent_roll, ParseError
 
+# PDF parsing is CPU-bound pure Python (table detection, OCR orchestration),
+# so it runs in separate processes to sidestep the GIL.  Each worker may
+# start its own OCR pool of cpu//4 processes running multi-threaded
+# Tesseract, so only a couple of PDFs are parsed at once.
+PDF_POOL_WORKERS = 2
+
+# Created on startup rather than at import: forkserver children re-import
+# the main module, and must not each build a pool of their own
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _new_pdf_pool() -> ProcessPoolExecutor:
+    """Create the PDF worker pool."""
+    # forkserver, not fork: the server already runs threads (event loop,
+    # threadpool) by the time the first PDF arrives
+    return ProcessPoolExecutor(
+        max_workers=PDF_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+
+
+async def parse_pdf_in_pool(file_path: str) -> dict:
+    """
+    Parse a PDF in the worker pool.
+
+    A worker that dies abruptly (a crash in MuPDF/Tesseract, an OOM kill)
+    breaks the whole pool, so it is replaced before the error is re-raised:
+    only the request that hit it fails.
+    """
+    global _pdf_pool
+    pool = _pdf_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, parse_rent_roll, file_path)
+    except BrokenProcessPool:
+        # Concurrent requests on the same broken pool replace it only once
+        if _pdf_pool is pool:
+            _pdf_pool = _new_pdf_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the PDF worker pool, and stop it on shutdown."""
+    global _pdf_pool
+    _pdf_pool = _new_pdf_pool()
+    yield
+    _pdf_pool.shutdown(cancel_futures=True)
+
+
 app = FastAPI(
     title="Danish Rent Roll Parser",
     description="API for parsing Danish rent roll files (Excel and PDF)",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Serialized /parse responses keyed by SHA-256 of the uploaded bytes, so
+# re-uploads of the same file (e.g. frontend retries) skip parsing entirely.
+# Bodies are kept as JSON bytes, several times smaller than the result
+# dicts, and the cache is bounded by their total size as well as by count
+RESULT_CACHE_SIZE = 64
+RESULT_CACHE_MAX_BYTES = 256 << 20
+_result_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_result_cache_bytes = 0
+
+
+def get_cached_result(cache_key: str) -> Union[bytes, None]:
+    """Return a cached response body and mark it as recently used."""
+    body = _result_cache.get(cache_key)
+    if body is not None:
+        _result_cache.move_to_end(cache_key)
+    return body
+
+
+def cache_result(cache_key: str, body: bytes) -> None:
+    """Store a response body, evicting least recently used entries when full."""
+    global _result_cache_bytes
+    if len(body) > RESULT_CACHE_MAX_BYTES:
+        return
+    previous = _result_cache.pop(cache_key, None)
+    if previous is not None:
+        _result_cache_bytes -= len(previous)
+    _result_cache[cache_key] = body
+    _result_cache_bytes += len(body)
+    while len(_result_cache) > RESULT_CACHE_SIZE or _result_cache_bytes > RESULT_CACHE_MAX_BYTES:
+        _, evicted = _result_cache.popitem(last=False)
+        _result_cache_bytes -= len(evicted)
+
+
 # CORS configuration - allow requests from Next.js frontend
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +129,15 @@ app.add_middleware(
 )
 
 
+def orjson_response(content: dict, status_code: int = 200) -> Response:
+    """Serialize a JSON-ready dict with orjson into a response."""
+    return Response(
+        orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -53,7 +158,7 @@ async def parse_file(file: UploadFile = File(...)):
 
     ext = os.path.splitext(file.filename)[1].lower()
     if ext not in [".xlsx", ".xls", ".pdf"]:
-        return JSONResponse(
+        return orjson_response(
             status_code=400,
             content={
                 "success": False,
@@ -62,28 +167,41 @@ async def parse_file(file: UploadFile = File(...)):
             },
         )
 
-    # Save uploaded file to temporary location
+    # Save uploaded file to temporary location, hashing it on the way so the
+    # whole upload never has to sit in memory
     try:
+        digest = hashlib.sha256()
         with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                tmp_file.write(chunk)
             tmp_path = tmp_file.name
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save uploaded file: {str(e)}")
 
+    # Extension is part of the key since it decides which parser runs
+    cache_key = f"{ext}:{digest.hexdigest()}"
+
     try:
-        # Parse the file
-        result = parse_rent_roll(tmp_path)
-        return {"success": True, **result}
+        # Cached responses are returned as stored, without re-serializing
+        body = get_cached_result(cache_key)
+        if body is not None:
+            return Response(body, media_type="application/json")
+
+        # Parse the file off the event loop so other requests keep being served
+        if ext == ".pdf":
+            result = await parse_pdf_in_pool(tmp_path)
+        else:
+            result = await run_in_threadpool(parse_rent_roll, tmp_path)
+        response = orjson_response({"success": True, **result})
+        cache_result(cache_key, response.body)
+        return response
 
     except ParseError as e:
-        return JSONResponse(
-            status_code=400,
-            content=e.to_dict(),
-        )
+        return orjson_response(e.to_dict(), status_code=400)
 
     except Exception as e:
-        return JSONResponse(
+        return orjson_response(
             status_code=500,
             content={
                 "success": False,